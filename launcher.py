@@ -1,10 +1,10 @@
 """
 Game Launcher - Choose between Sudoku and Maze Solver
 """
+import threading
 import flet as ft
-import subprocess
-import sys
-import os
+from main import main as sudoku_main
+from maze_solver import main as maze_main
 
 
 class GameLauncher:
@@ -12,16 +12,41 @@ class GameLauncher:
     
     def __init__(self, page: ft.Page):
         self.page = page
-        self.setup_ui()
+        self.setup_page()
+        self.show_splash()
+        # Build the real interface off the UI thread while the splash is visible
+        threading.Thread(target=self._build_and_install, daemon=True).start()
     
-    def setup_ui(self):
-        """Set up the launcher interface."""
+    def setup_page(self):
+        """Set up the page properties for the launcher."""
         self.page.title = "Game Launcher"
         self.page.theme_mode = ft.ThemeMode.LIGHT
         self.page.padding = 40
         self.page.window_width = 500
         self.page.window_height = 400
-        
+    
+    def show_splash(self):
+        """Show a minimal loading indicator while the launcher is built."""
+        self.page.add(
+            ft.Column(
+                [
+                    ft.ProgressRing(),
+                    ft.Text("Loading...", size=14, color=ft.Colors.GREY_500),
+                ],
+                alignment=ft.MainAxisAlignment.CENTER,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=10
+            )
+        )
+    
+    def _build_and_install(self):
+        """Build the launcher interface and swap it in for the splash."""
+        layout = self.build_ui()
+        self.page.controls.clear()
+        self.page.add(layout)
+    
+    def build_ui(self) -> ft.Column:
+        """Build the launcher interface."""
         # Title
         title = ft.Text(
             "🎮 Game Collection",
@@ -79,63 +104,56 @@ class GameLauncher:
         )
         
         # Main layout
-        self.page.add(
-            ft.Column(
-                [
-                    title,
-                    subtitle,
-                    ft.Container(height=30),  # Spacer
-                    games_row,
-                    ft.Container(height=20),  # Spacer
-                    self.status_text,
-                ],
-                alignment=ft.MainAxisAlignment.CENTER,
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=10
-            )
+        return ft.Column(
+            [
+                title,
+                subtitle,
+                ft.Container(height=30),  # Spacer
+                games_row,
+                ft.Container(height=20),  # Spacer
+                self.status_text,
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=10
         )
     
+    def _clear_page(self):
+        """Remove the launcher controls so a game can take over the page."""
+        self.page.controls.clear()
+        self.page.update()
+    
+    def _show_error(self, message: str):
+        """Restore the launcher interface and report a launch failure."""
+        self.setup_page()
+        self.page.controls.clear()
+        layout = self.build_ui()
+        self.status_text.value = message
+        self.page.add(layout)
+    
     def launch_sudoku(self, e):
         """Launch the Sudoku game."""
         self.status_text.value = "Launching Sudoku Game..."
         self.page.update()
         
         try:
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            venv_python = os.path.join(script_dir, ".venv", "bin", "python")
-            main_py = os.path.join(script_dir, "main.py")
-            
-            if os.path.exists(venv_python) and os.path.exists(main_py):
-                subprocess.Popen([venv_python, main_py])
-                self.status_text.value = "Sudoku Game launched! 🧩"
-            else:
-                self.status_text.value = "Error: Could not find Sudoku game files."
+            # Run the game in this process, reusing the already imported flet
+            self._clear_page()
+            sudoku_main(self.page)
         except Exception as ex:
-            self.status_text.value = f"Error launching Sudoku: {str(ex)}"
-        
-        self.page.update()
+            self._show_error(f"Error launching Sudoku: {str(ex)}")
     
-    def launch_maze(self, e):
+    async def launch_maze(self, e):
         """Launch the Maze Solver."""
         self.status_text.value = "Launching Maze Solver..."
         self.page.update()
         
         try:
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            venv_python = os.path.join(script_dir, ".venv", "bin", "python")
-            maze_py = os.path.join(script_dir, "maze_solver.py")
-            
-            if os.path.exists(venv_python) and os.path.exists(maze_py):
-                subprocess.Popen([venv_python, maze_py])
-                self.status_text.value = "Maze Solver launched! 🌟"
-            else:
-                self.status_text.value = "Error: Could not find Maze Solver files."
+            # Run the game in this process, reusing the already imported flet
+            self._clear_page()
+            await maze_main(self.page)
         except Exception as ex:
-            self.status_text.value = f"Error launching Maze Solver: {str(ex)}"
-        
-        self.page.update()
+            self._show_error(f"Error launching Maze Solver: {str(ex)}")
 
 
 def main(page: ft.Page):
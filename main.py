@@ -1,27 +1,117 @@
 """
 Main Sudoku game application using Flet.
 """
+import random
+import threading
+from collections import deque
 import flet as ft
-from typing import List, Optional
-from sudoku_solver import SudokuSolver
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+# Number of ready-made puzzles kept per difficulty
+PUZZLE_CACHE_SIZE = 4
+
+# Mistakes allowed before game over, and hints allowed per difficulty
+MAX_MISTAKES = 3
+_HINT_LIMITS = {
+    "easy": 30,
+    "medium": 18,
+    "hard": 10
+}
+
+# Counter labels, built once; index by the current count
+_MISTAKE_LABELS = tuple(f"Mistakes: {i}/{MAX_MISTAKES}" for i in range(MAX_MISTAKES + 1))
+_HINT_LABELS = {
+    limit: tuple(f"Hints: {i}/{limit}" for i in range(limit + 1))
+    for limit in _HINT_LIMITS.values()
+}
+
+
+# Board colors, bound once so per-cell code avoids repeated ft.Colors lookups
+_WHITE = ft.Colors.WHITE
+_BLACK = ft.Colors.BLACK
+_GREY_100 = ft.Colors.GREY_100
+_GREY_400 = ft.Colors.GREY_400
+_GREEN_100 = ft.Colors.GREEN_100
+_RED_100 = ft.Colors.RED_100
+_YELLOW_100 = ft.Colors.YELLOW_100
+_BLUE_800 = ft.Colors.BLUE_800
+
+# Cell styles as (read_only, bgcolor, text color)
+_EDITABLE_STYLE = (False, _WHITE, _BLACK)
+_GIVEN_STYLE = (True, _GREY_100, _BLUE_800)
+_STYLE_BY_GIVEN = (_EDITABLE_STYLE, _GIVEN_STYLE)  # Indexed by bool(value)
+
+# 3x3 box number (0-8) of each flat cell index
+_BOX_OF = tuple((r // 3) * 3 + c // 3 for r in range(9) for c in range(9))
+
+# Parsed cell input: "" clears a cell and "1"-"9" place a digit; anything else is invalid
+_DIGIT = {"": 0, **{str(i): i for i in range(1, 10)}}
+
+# Static rule lines shown in the welcome dialog
+_WELCOME_RULES = (
+    "• Choose your difficulty level",
+    "• Fill the 9×9 grid with numbers 1-9",
+    "• Each row, column, and 3×3 box must contain all digits",
+    "• You have 3 mistakes before game over",
+    "• Hints available: Easy (30), Medium (18), Hard (10)",
+)
+
+# Display text for each cell value; 0 (empty) renders as a blank cell
+_DIGIT_STR = ("", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+
+def _flatten(board: List[List[int]]) -> bytearray:
+    """Pack a 9x9 board into a flat row-major bytearray of 81 cells."""
+    return bytearray(value for row in board for value in row)
+
+
+def _apply_style(cell: ft.TextField, value: int) -> bool:
+    """Render value into cell, returning False if the cell already showed it."""
+    text = _DIGIT_STR[value]
+    read_only, bgcolor, color = _STYLE_BY_GIVEN[value != 0]
+    if (cell.value == text and cell.read_only == read_only
+            and cell.bgcolor == bgcolor and cell.color == color):
+        return False
+    cell.value = text
+    cell.read_only = read_only
+    cell.bgcolor = bgcolor
+    cell.color = color
+    return True
 
 
 class SudokuGame:
     """Main Sudoku game class with Flet UI."""
     
+    # Input filters are stateless and serialized per control, so one instance is shared
+    _NUM_FILTER = ft.NumbersOnlyInputFilter()
+    
     def __init__(self, page: ft.Page):
         self.page = page
-        self.solver = SudokuSolver()
-        self.puzzle_board: List[List[int]] = []
-        self.solution_board: List[List[int]] = []
-        self.initial_board: List[List[int]] = []  # To track which cells are editable
-        self.board_controls: List[List[ft.TextField]] = []
+        self.solver = None  # Created on first use, off the startup path
+        # Boards are flat row-major bytearrays; cell (row, col) lives at row * 9 + col
+        self.puzzle_board = bytearray(81)
+        self.solution_board = bytearray(81)
+        self.initial_board = bytes(81)  # Read-only snapshot; non-zero cells are not editable
+        self.board_cells: List[ft.TextField] = []
+        self._empty_cells: Set[int] = set()  # Flat indices of empty editable cells
+        # 9-bit digit masks (bit num - 1) of correctly placed digits per row, column and box
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
         self.difficulty = "medium"
         self.mistakes = 0
-        self.max_mistakes = 3
+        self.max_mistakes = MAX_MISTAKES
         self.hints_used = 0
-        self.max_hints = 18  # Default for medium
+        self.max_hints = _HINT_LIMITS["medium"]
         self.game_active = False  # Track if game is currently active
+        self._welcome_dialog: Optional[ft.AlertDialog] = None  # Built on first show
+        
+        # Pre-generated (puzzle, solution) pairs per difficulty, refilled in the background
+        self._puzzle_cache: Dict[str, Deque[Tuple[List[List[int]], List[List[int]]]]] = {
+            difficulty: deque(maxlen=PUZZLE_CACHE_SIZE) for difficulty in ("easy", "medium", "hard")
+        }
+        self._refill_lock = threading.Lock()
+        self._refilling = False
         
         # UI Components
         self.title = ft.Text(
@@ -43,13 +133,13 @@ class SudokuGame:
         )
         
         self.mistakes_text = ft.Text(
-            f"Mistakes: {self.mistakes}/{self.max_mistakes}",
+            _MISTAKE_LABELS[self.mistakes],
             size=16,
             color=ft.Colors.RED_400
         )
         
         self.hints_text = ft.Text(
-            f"Hints: {self.hints_used}/{self.max_hints}",
+            _HINT_LABELS[self.max_hints][self.hints_used],
             size=16,
             color=ft.Colors.BLUE_400
         )
@@ -112,6 +202,7 @@ class SudokuGame:
         self.setup_board()
         self.setup_page()
         self.show_welcome_dialog()
+        self._start_cache_refill()
     
     def setup_page(self):
         """Set up the page layout and styling."""
@@ -183,9 +274,8 @@ class SudokuGame:
     
     def setup_board(self):
         """Initialize the board controls."""
-        self.board_controls = []
+        self.board_cells = []
         for i in range(9):
-            row = []
             for j in range(9):
                 text_field = ft.TextField(
                     width=50,
@@ -193,37 +283,38 @@ class SudokuGame:
                     text_align=ft.TextAlign.CENTER,
                     text_size=18,
                     border_radius=5,
-                    on_change=lambda e, r=i, c=j: self.on_cell_change(e, r, c),
-                    input_filter=ft.NumbersOnlyInputFilter(),
+                    key=f"c{i}{j}",  # Stable per-cell key for the client
+                    data=(i, j),
+                    read_only=True,  # Unlocked by new_game once a puzzle is loaded
+                    on_change=self._cell_edited,
+                    on_blur=self._cell_committed,
+                    on_submit=self._cell_committed,
+                    input_filter=self._NUM_FILTER,
                     max_length=1,
                 )
-                row.append(text_field)
-            self.board_controls.append(row)
+                self.board_cells.append(text_field)
     
     def create_board_ui(self) -> ft.Container:
         """Create the Sudoku board UI."""
         board_rows = []
+        thin = ft.BorderSide(1, _GREY_400)
+        thick = ft.BorderSide(2, _BLACK)
+        # Only a handful of distinct borders exist; build each one once
+        border_cache: Dict[Tuple[bool, bool, bool, bool], ft.Border] = {}
         
         for i in range(9):
             board_cols = []
             for j in range(9):
-                # Add thicker borders for 3x3 box separation
-                border = ft.border.all(1, ft.Colors.GREY_400)
-                if i % 3 == 0 and i != 0:
-                    border.top = ft.BorderSide(2, ft.Colors.BLACK)
-                if j % 3 == 0 and j != 0:
-                    border.left = ft.BorderSide(2, ft.Colors.BLACK)
-                if i == 8:
-                    border.bottom = ft.BorderSide(2, ft.Colors.BLACK)
-                if j == 8:
-                    border.right = ft.BorderSide(2, ft.Colors.BLACK)
-                if i == 0:
-                    border.top = ft.BorderSide(2, ft.Colors.BLACK)
-                if j == 0:
-                    border.left = ft.BorderSide(2, ft.Colors.BLACK)
+                # Add thicker borders for 3x3 box separation and the outer frame
+                key = (i % 3 == 0, i == 8, j % 3 == 0, j == 8)
+                border = border_cache.get(key)
+                if border is None:
+                    top, bottom, left, right = (thick if edge else thin for edge in key)
+                    border = ft.border.only(left=left, top=top, right=right, bottom=bottom)
+                    border_cache[key] = border
                 
                 cell_container = ft.Container(
-                    content=self.board_controls[i][j],
+                    content=self.board_cells[i * 9 + j],
                     border=border,
                     padding=0,
                     margin=0,
@@ -258,26 +349,31 @@ class SudokuGame:
     
     def show_welcome_dialog(self):
         """Show welcome dialog when the application starts."""
+        if self._welcome_dialog is None:
+            self._welcome_dialog = self._build_welcome_dialog()
+        
+        self.page.dialog = self._welcome_dialog
+        self._welcome_dialog.open = True
+        self.page.update()
+    
+    def _build_welcome_dialog(self) -> ft.AlertDialog:
+        """Build the welcome dialog once; later openings reuse it."""
         def close_dialog(e):
-            welcome_dialog.open = False
+            self._welcome_dialog.open = False
             self.page.update()
         
         def start_new_game(e):
-            welcome_dialog.open = False
+            self._welcome_dialog.open = False
             self.page.update()
             self.new_game(e)
         
-        welcome_dialog = ft.AlertDialog(
+        return ft.AlertDialog(
             modal=True,
             title=ft.Text("Welcome to Sudoku!", size=24, weight=ft.FontWeight.BOLD),
             content=ft.Column([
                 ft.Text("🧩 Ready to challenge your mind?", size=16, text_align=ft.TextAlign.CENTER),
                 ft.Text(""),
-                ft.Text("• Choose your difficulty level", size=14),
-                ft.Text("• Fill the 9×9 grid with numbers 1-9", size=14),
-                ft.Text("• Each row, column, and 3×3 box must contain all digits", size=14),
-                ft.Text("• You have 3 mistakes before game over", size=14),
-                ft.Text("• Hints available: Easy (30), Medium (18), Hard (10)", size=14),
+                *[ft.Text(rule, size=14) for rule in _WELCOME_RULES],
                 ft.Text(""),
                 ft.Text("Good luck and have fun! 🎯", size=16, text_align=ft.TextAlign.CENTER, weight=ft.FontWeight.BOLD),
             ], 
@@ -297,26 +393,19 @@ class SudokuGame:
             ],
             actions_alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
-        
-        self.page.dialog = welcome_dialog
-        welcome_dialog.open = True
-        self.page.update()
     
     def get_max_hints_for_difficulty(self, difficulty: str) -> int:
         """Get maximum hints allowed for the given difficulty."""
-        hint_limits = {
-            "easy": 30,
-            "medium": 18,
-            "hard": 10
-        }
-        return hint_limits.get(difficulty, 18)
+        return _HINT_LIMITS.get(difficulty, _HINT_LIMITS["medium"])
     
     def difficulty_changed(self, e):
         """Handle difficulty change."""
         # This should only be called when game is not active (dropdown is enabled)
         self.difficulty = e.control.value
         self.max_hints = self.get_max_hints_for_difficulty(self.difficulty)
-        self.hints_text.value = f"Hints: {self.hints_used}/{self.max_hints}"
+        # Counters now describe the next game; a finished game may have used more hints
+        self.hints_used = 0
+        self.hints_text.value = _HINT_LABELS[self.max_hints][self.hints_used]
         self.hint_btn.text = f"Hint ({self.max_hints - self.hints_used})"
         # Make instruction text more prominent when difficulty changes
         self.instruction_text.visible = True
@@ -324,22 +413,31 @@ class SudokuGame:
         self.instruction_text.color = ft.Colors.BLUE_700
         self.status_text.value = f"Difficulty changed to {self.difficulty}. Ready to challenge yourself?"
         self.status_text.color = ft.Colors.BLACK
-        self.page.update()
+        self.page.update(self.hints_text, self.hint_btn, self.instruction_text, self.status_text)
     
     def new_game(self, e):
         """Start a new game."""
         self.mistakes = 0
         self.hints_used = 0
         self.max_hints = self.get_max_hints_for_difficulty(self.difficulty)
-        self.mistakes_text.value = f"Mistakes: {self.mistakes}/{self.max_mistakes}"
-        self.hints_text.value = f"Hints: {self.hints_used}/{self.max_hints}"
-        
-        # Generate new puzzle
-        self.puzzle_board, self.solution_board = self.solver.generate_puzzle(self.difficulty)
-        self.initial_board = [row[:] for row in self.puzzle_board]  # Deep copy
+        self.mistakes_text.value = _MISTAKE_LABELS[self.mistakes]
+        self.hints_text.value = _HINT_LABELS[self.max_hints][self.hints_used]
+        
+        # Take a pre-generated puzzle if one is ready, otherwise generate it now
+        cache = self._puzzle_cache[self.difficulty]
+        try:
+            puzzle, solution = cache.popleft()
+        except IndexError:
+            puzzle, solution = self._get_solver().generate_puzzle(self.difficulty)
+        self._start_cache_refill()
+        self.puzzle_board = _flatten(puzzle)
+        self.solution_board = _flatten(solution)
+        self.initial_board = bytes(self.puzzle_board)  # Immutable snapshot
+        self._empty_cells = {k for k in range(81) if self.puzzle_board[k] == 0}
+        self._rebuild_masks()
         
         # Update UI
-        self.update_board_display()
+        changed_cells = self.update_board_display()
         self.instruction_text.visible = False  # Hide instruction text once game starts
         
         # Set game as active
@@ -356,70 +454,167 @@ class SudokuGame:
         
         self.status_text.value = f"New {self.difficulty} game started! Good luck!"
         self.status_text.color = ft.Colors.BLACK
-        self.page.update()
+        self.page.update(
+            *changed_cells,
+            self.mistakes_text,
+            self.hints_text,
+            self.instruction_text,
+            self.difficulty_dropdown,
+            self.difficulty_lock_text,
+            self.hint_btn,
+            self.status_text,
+        )
     
-    def update_board_display(self):
-        """Update the board display with current values."""
-        for i in range(9):
-            for j in range(9):
-                cell = self.board_controls[i][j]
-                value = self.puzzle_board[i][j]
-                
-                if value == 0:
-                    cell.value = ""
-                    cell.read_only = False
-                    cell.bgcolor = ft.Colors.WHITE
-                    cell.color = ft.Colors.BLACK
-                else:
-                    cell.value = str(value)
-                    cell.read_only = True
-                    cell.bgcolor = ft.Colors.GREY_100
-                    cell.color = ft.Colors.BLUE_800
+    def _get_solver(self):
+        """Return the puzzle solver, importing and creating it on first use."""
+        if self.solver is None:
+            from sudoku_solver import SudokuSolver
+            self.solver = SudokuSolver()
+        return self.solver
+    
+    def _start_cache_refill(self):
+        """Start the background puzzle generator unless it is already running."""
+        with self._refill_lock:
+            if self._refilling:
+                return
+            self._refilling = True
+        threading.Thread(target=self._refill_puzzle_cache, daemon=True).start()
+    
+    def _refill_puzzle_cache(self):
+        """Generate puzzles until every difficulty's cache is full."""
+        solver = self._get_solver()
+        while True:
+            with self._refill_lock:
+                missing = [d for d, cache in self._puzzle_cache.items() if len(cache) < cache.maxlen]
+                if not missing:
+                    self._refilling = False
+                    return
+            # Top up the currently selected difficulty first
+            difficulty = self.difficulty if self.difficulty in missing else missing[0]
+            self._puzzle_cache[difficulty].append(solver.generate_puzzle(difficulty))
+    
+    def update_board_display(self) -> List[ft.TextField]:
+        """Update the board display with current values and return the cells that changed."""
+        return [cell for cell, value in zip(self.board_cells, self.puzzle_board)
+                if _apply_style(cell, value)]
+    
+    def _cell_edited(self, e):
+        """Clear stale feedback while a cell is edited; validation waits for blur."""
+        if e.control.bgcolor != _WHITE:
+            e.control.bgcolor = _WHITE
+            e.control.update()
+    
+    def _cell_committed(self, e):
+        """Shared on_blur/on_submit handler; the cell position is stored in the control's data."""
+        row, col = e.control.data
+        self.on_cell_change(e, row, col)
     
     def on_cell_change(self, e, row: int, col: int):
-        """Handle cell value change."""
-        if self.initial_board[row][col] != 0:  # Can't edit initial numbers
-            return
+        """Validate a committed cell value and send one targeted update."""
+        dirty = self._apply_cell_change(row * 9 + col, e.control.value)
+        if dirty:
+            self.page.update(*dirty)
+    
+    def _apply_cell_change(self, index: int, value: str) -> List[ft.Control]:
+        """Validate a cell value and return the controls that changed."""
+        cell = self.board_cells[index]
+        if self.initial_board[index] != 0 or cell.read_only:  # Givens, hints and finished boards
+            return []
+        
+        old_num = self.puzzle_board[index]
+        num = _DIGIT.get(value, -1)
+        rejected = num < 0
+        if rejected:  # Reject "0" or anything else the input filter let through
+            cell.value = ""
+            num = 0
+        
+        if num == 0:
+            bgcolor = _WHITE
+        elif self.solution_board[index] == num:
+            bgcolor = _GREEN_100
+        else:
+            bgcolor = _RED_100
         
-        value = e.control.value
-        if value == "":
-            self.puzzle_board[row][col] = 0
-            e.control.bgcolor = ft.Colors.WHITE
+        if num == old_num and not rejected and cell.bgcolor == bgcolor:
+            return []  # Focus left the cell without changing it
+        
+        cell.bgcolor = bgcolor
+        dirty = [cell]
+        if num == old_num:
+            return dirty  # Same value re-entered; only its feedback color is restored
+        
+        self.puzzle_board[index] = num
+        if bgcolor == _RED_100:
+            self.mistakes += 1
+            self.mistakes_text.value = _MISTAKE_LABELS[self.mistakes]
+            dirty.append(self.mistakes_text)
+            
+            if self.mistakes >= self.max_mistakes:
+                self.status_text.value = "Game Over! Too many mistakes."
+                dirty.append(self.status_text)
+                dirty.extend(self.disable_board())
+        
+        # Keep the empty-cell index and digit masks in step with the board
+        if num:
+            self._empty_cells.discard(index)
         else:
-            try:
-                num = int(value)
-                if 1 <= num <= 9:
-                    self.puzzle_board[row][col] = num
-                    
-                    # Check if the move is correct
-                    if self.solution_board[row][col] == num:
-                        e.control.bgcolor = ft.Colors.GREEN_100
-                    else:
-                        e.control.bgcolor = ft.Colors.RED_100
-                        self.mistakes += 1
-                        self.mistakes_text.value = f"Mistakes: {self.mistakes}/{self.max_mistakes}"
-                        
-                        if self.mistakes >= self.max_mistakes:
-                            self.status_text.value = "Game Over! Too many mistakes."
-                            self.disable_board()
-                else:
-                    e.control.value = ""
-                    self.puzzle_board[row][col] = 0
-            except ValueError:
-                e.control.value = ""
-                self.puzzle_board[row][col] = 0
+            self._empty_cells.add(index)
+        if old_num and old_num == self.solution_board[index]:
+            self._toggle_mask(index, old_num)
+        if num and num == self.solution_board[index]:
+            self._toggle_mask(index, num)
         
-        self.page.update()
+        return dirty
+    
+    def _commit_pending_cells(self) -> List[ft.Control]:
+        """Validate cells edited but not yet blurred, returning the controls that changed."""
+        # Buttons do not take focus, so the cell being typed in may not have blurred yet
+        dirty = []
+        for index, cell in enumerate(self.board_cells):
+            value = cell.value or ""
+            if value != _DIGIT_STR[self.puzzle_board[index]]:
+                dirty.extend(self._apply_cell_change(index, value))
+        return dirty
+    
+    def _rebuild_masks(self):
+        """Recompute the row, column and box masks from the correctly placed digits."""
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        for index, num in enumerate(self.puzzle_board):
+            if num and num == self.solution_board[index]:
+                self._toggle_mask(index, num)
+    
+    def _toggle_mask(self, index: int, num: int):
+        """Flip the bit for num in the masks covering the cell at index."""
+        row, col = divmod(index, 9)
+        bit = 1 << (num - 1)
+        self.row_mask[row] ^= bit
+        self.col_mask[col] ^= bit
+        self.box_mask[_BOX_OF[index]] ^= bit
+    
+    def is_legal(self, row: int, col: int, num: int) -> bool:
+        """Check that num clashes with no correctly placed digit in its row, column or box."""
+        used = self.row_mask[row] | self.col_mask[col] | self.box_mask[_BOX_OF[row * 9 + col]]
+        return not used & (1 << (num - 1))
     
     def check_solution(self, e):
         """Check if the current solution is correct."""
-        if self.solver.check_solution(self.puzzle_board):
+        was_active = self.game_active
+        dirty = self._commit_pending_cells()
+        if was_active and not self.game_active:
+            self.page.update(*dirty)  # The pending edit ended the game
+            return
+        
+        dirty.append(self.status_text)
+        # The solution is known up front, so a full-board comparison is enough
+        is_complete = 0 not in self.puzzle_board
+        if is_complete and self.puzzle_board == self.solution_board:
             self.status_text.value = "Congratulations! You solved the puzzle!"
             self.status_text.color = ft.Colors.GREEN
-            self.disable_board()
+            dirty.extend(self.disable_board())
         else:
             # Check if puzzle is complete but incorrect
-            is_complete = all(self.puzzle_board[i][j] != 0 for i in range(9) for j in range(9))
             if is_complete:
                 self.status_text.value = "Puzzle is complete but has errors. Keep trying!"
                 self.status_text.color = ft.Colors.RED
@@ -427,38 +622,44 @@ class SudokuGame:
                 self.status_text.value = "Puzzle is not complete yet. Keep going!"
                 self.status_text.color = ft.Colors.ORANGE
         
-        self.page.update()
+        self.page.update(*dirty)
     
     def give_hint(self, e):
         """Provide a hint by filling one empty cell."""
+        was_active = self.game_active
+        dirty = self._commit_pending_cells()
+        if was_active and not self.game_active:
+            self.page.update(*dirty)  # The pending edit ended the game
+            return
+        
         # Check if hints are exhausted
         if self.hints_used >= self.max_hints:
             self.status_text.value = f"No more hints available! You've used all {self.max_hints} hints for {self.difficulty} difficulty."
             self.status_text.color = ft.Colors.RED
-            self.page.update()
+            self.page.update(self.status_text, *dirty)
             return
         
-        empty_cells = [(i, j) for i in range(9) for j in range(9) 
-                      if self.puzzle_board[i][j] == 0 and self.initial_board[i][j] == 0]
-        
-        if not empty_cells:
+        if not self._empty_cells:
             self.status_text.value = "No empty cells to hint!"
-            self.page.update()
+            self.page.update(self.status_text, *dirty)
             return
         
         # Pick a random empty cell
-        import random
-        row, col = random.choice(empty_cells)
-        correct_value = self.solution_board[row][col]
-        
-        self.puzzle_board[row][col] = correct_value
-        self.board_controls[row][col].value = str(correct_value)
-        self.board_controls[row][col].bgcolor = ft.Colors.YELLOW_100
-        self.board_controls[row][col].read_only = True
+        index = random.choice(tuple(self._empty_cells))
+        self._empty_cells.discard(index)
+        row, col = divmod(index, 9)
+        correct_value = self.solution_board[index]
+        
+        self.puzzle_board[index] = correct_value
+        self._toggle_mask(index, correct_value)
+        cell = self.board_cells[index]
+        cell.value = _DIGIT_STR[correct_value]
+        cell.bgcolor = _YELLOW_100
+        cell.read_only = True
         
         # Update hint counter
         self.hints_used += 1
-        self.hints_text.value = f"Hints: {self.hints_used}/{self.max_hints}"
+        self.hints_text.value = _HINT_LABELS[self.max_hints][self.hints_used]
         
         remaining_hints = self.max_hints - self.hints_used
         self.status_text.value = f"Hint: Added {correct_value} at row {row+1}, column {col+1}. {remaining_hints} hints left."
@@ -472,21 +673,28 @@ class SudokuGame:
         else:
             self.hint_btn.text = f"Hint ({remaining_hints})"
         
-        self.page.update()
+        self.page.update(cell, self.hints_text, self.status_text, self.hint_btn, *dirty)
     
     def solve_puzzle(self, e):
         """Show the complete solution."""
-        self.puzzle_board = [row[:] for row in self.solution_board]
-        self.update_board_display()
-        self.disable_board()
+        if not any(self.solution_board):
+            return  # No puzzle has been loaded yet
+        
+        dirty = self._commit_pending_cells()  # Count a pending wrong digit before revealing
+        self.puzzle_board[:] = self.solution_board
+        self._empty_cells.clear()
+        self._rebuild_masks()
+        dirty.extend(self.update_board_display())
+        dirty.extend(self.disable_board())
         self.status_text.value = "Puzzle solved automatically!"
-        self.page.update()
+        self.page.update(self.status_text, *dirty)
     
-    def disable_board(self):
-        """Disable all board interactions."""
-        for i in range(9):
-            for j in range(9):
-                self.board_controls[i][j].read_only = True
+    def disable_board(self) -> List[ft.Control]:
+        """Disable all board interactions and return the controls that changed."""
+        # Givens and hinted cells are already read-only; only touch the rest
+        changed = [cell for cell in self.board_cells if not cell.read_only]
+        for cell in changed:
+            cell.read_only = True
         
         # Mark game as inactive so difficulty can be changed again
         self.game_active = False
@@ -499,6 +707,13 @@ class SudokuGame:
         self.instruction_text.visible = True
         self.instruction_text.value = "🎯 Ready for another challenge? Select difficulty and click 'New Game'!"
         self.instruction_text.color = ft.Colors.PURPLE_600
+        
+        return [
+            *changed,
+            self.difficulty_dropdown,
+            self.difficulty_lock_text,
+            self.instruction_text,
+        ]
 
 
 def main(page: ft.Page):
@@ -0,0 +1,84 @@
+"""
+Maze search kernels with no UI dependencies.
+
+The maze is a flat grid of wall flags (1 = wall) where cell (x, y) lives at
+index y * size + x. Each search returns the order in which cells were
+expanded and a packed int array of parent indices (-1 for none), so the UI
+can replay the search at its own pace.
+"""
+from array import array
+from collections import deque
+from typing import List, Sequence, Tuple
+
+# Neighbor offsets in exploration order: right, down, left, up
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+def dfs_trace(walls: Sequence[int], size: int, start: int, end: int) -> Tuple[List[int], array]:
+    """Run Depth-First Search from start and return (expansion order, parents)."""
+    parent = array('i', [-1]) * (size * size)
+    visited = bytearray(size * size)
+    order = []
+    stack = [start]
+    
+    while stack:
+        current = stack.pop()
+        if visited[current]:
+            continue
+        
+        visited[current] = 1
+        order.append(current)
+        if current == end:
+            break
+        
+        # Explore neighbors (right, down, left, up)
+        y, x = divmod(current, size)
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < size and 0 <= ny < size:
+                neighbor = ny * size + nx
+                if not walls[neighbor] and not visited[neighbor]:
+                    stack.append(neighbor)
+                    if parent[neighbor] == -1:
+                        parent[neighbor] = current
+    
+    return order, parent
+
+
+def bfs_trace(walls: Sequence[int], size: int, start: int, end: int) -> Tuple[List[int], array]:
+    """Run Breadth-First Search from start and return (expansion order, parents)."""
+    parent = array('i', [-1]) * (size * size)
+    visited = bytearray(size * size)
+    visited[start] = 1
+    order = []
+    queue = deque([start])
+    
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        if current == end:
+            break
+        
+        # Explore neighbors (right, down, left, up)
+        y, x = divmod(current, size)
+        for dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < size and 0 <= ny < size:
+                neighbor = ny * size + nx
+                if not walls[neighbor] and not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+                    parent[neighbor] = current
+    
+    return order, parent
+
+
+def trace_path(parent: Sequence[int], end: int) -> List[int]:
+    """Follow parent links back from end; the result excludes the start cell."""
+    path = []
+    current = end
+    while parent[current] != -1:
+        path.append(current)
+        current = parent[current]
+    path.reverse()
+    return path
\ No newline at end of file
@@ -4,22 +4,23 @@ Maze solver with DFS and BFS algorithm visualization using Flet.
 import flet as ft
 import random
 import time
-from typing import List, Tuple, Set
-from collections import deque
+from typing import List, Sequence, Tuple, Set
 import asyncio
+from maze_kernels import DIRECTIONS, bfs_trace, dfs_trace, trace_path
 
+# Algorithm states stored per cell in MazeSolver.state
+UNVISITED, VISITING, FRONTIER, VISITED = range(4)
 
-class MazeCell:
-    """Represents a single cell in the maze."""
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-        self.is_wall = False
-        self.is_start = False
-        self.is_end = False
-        self.is_visited = False
-        self.is_path = False
-        self.algorithm_state = "unvisited"  # "unvisited", "visiting", "frontier", "visited", "path"
+# Two-cell carving steps used by maze generation: right, down, left, up
+_CARVE_STEPS: Tuple[Tuple[int, int], ...] = ((2, 0), (0, 2), (-2, 0), (0, -2))
+
+# Search replays repaint at most once per frame (60 fps)
+_FRAME_SECONDS = 1 / 60
+
+
+def _replay_rate(speed: float) -> float:
+    """Return the cells replayed per second at a slider speed of 1x-10x."""
+    return max(1, int(speed)) / ((11 - speed) * 0.05)
 
 
 class MazeSolver:
@@ -28,12 +29,24 @@ class MazeSolver:
     def __init__(self, page: ft.Page):
         self.page = page
         self.maze_size = 21  # Odd number for proper maze generation
-        self.maze: List[List[MazeCell]] = []
-        self.maze_controls: List[List[ft.Container]] = []
+        # Struct-of-arrays cell storage; cell (x, y) lives at index y * maze_size + x
+        cell_count = self.maze_size * self.maze_size
+        self.walls = bytearray(cell_count)    # 1 = wall
+        self.state = bytearray(cell_count)    # UNVISITED / VISITING / FRONTIER / VISITED
+        self.is_path = bytearray(cell_count)  # 1 = on the solution path
+        self.maze_controls: List[ft.Container] = []  # Flat, same indexing as the arrays
+        self._dirty: Set[int] = set()  # Cells whose color may have changed since the last repaint
+        self._frontier_cells: Set[int] = set()  # Cells currently in the FRONTIER state
         self.start_pos = (1, 1)
         self.end_pos = (self.maze_size - 2, self.maze_size - 2)
+        self.start_idx = self.start_pos[1] * self.maze_size + self.start_pos[0]
+        self.end_idx = self.end_pos[1] * self.maze_size + self.end_pos[0]
         self.solving = False
         self.current_algorithm = "DFS"
+        # Replay pacing, kept in sync with the speed slider (starts at 5x)
+        self._cells_per_second = _replay_rate(5)
+        self._step_budget = 0.0  # Cells the replay may still advance this frame
+        self._last_frame = 0.0
         
         # Colors for different cell states
         self.colors = {
@@ -47,6 +60,13 @@ class MazeSolver:
             "path": ft.Colors.PINK_400,        # Solution path - pink for distinction
             "border": ft.Colors.GREY_400
         }
+        # Color for each algorithm state, indexed by the values in self.state
+        self.state_colors = (
+            None,
+            self.colors["visiting"],
+            self.colors["frontier"],
+            self.colors["visited"],
+        )
         
         self.setup_ui()
         self.generate_maze()
@@ -114,7 +134,8 @@ class MazeSolver:
             value=5,
             divisions=9,
             label="{value}x",
-            width=200
+            width=200,
+            on_change=self.speed_changed
         )
         
         # Controls layout
@@ -175,12 +196,10 @@ class MazeSolver:
     
     def create_maze_display(self):
         """Create the visual maze display."""
-        self.maze = [[MazeCell(x, y) for x in range(self.maze_size)] for y in range(self.maze_size)]
         self.maze_controls = []
         
         rows = []
         for y in range(self.maze_size):
-            row_controls = []
             row_containers = []
             for x in range(self.maze_size):
                 container = ft.Container(
@@ -196,10 +215,9 @@ class MazeSolver:
                         offset=ft.Offset(0, 0),
                     ),
                 )
-                row_controls.append(container)
                 row_containers.append(container)
             
-            self.maze_controls.append(row_controls)
+            self.maze_controls.extend(row_containers)
             rows.append(ft.Row(row_containers, spacing=0.5))  # Smaller spacing
         
         self.maze_container = ft.Container(
@@ -221,77 +239,111 @@ class MazeSolver:
         self.status_text.value = f"{self.current_algorithm} algorithm selected. Ready to solve!"
         self.page.update()
     
+    def speed_changed(self, e):
+        """Handle speed slider change."""
+        self._cells_per_second = _replay_rate(e.control.value)
+    
     def generate_maze(self):
         """Generate a random maze using recursive backtracking."""
-        # Initialize all cells as walls
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                self.maze[y][x].is_wall = True
-                self.maze[y][x].is_visited = False
-                self.maze[y][x].is_path = False
-                self.maze[y][x].algorithm_state = "unvisited"
+        # Reset all cells to walls, reusing the existing arrays
+        cell_count = self.maze_size * self.maze_size
+        self.walls[:] = b"\x01" * cell_count
+        self.state[:] = bytes(cell_count)
+        self.is_path[:] = bytes(cell_count)
+        self._dirty.update(range(cell_count))  # Every cell may change
+        self._frontier_cells.clear()
         
-        # Create maze using recursive backtracking
-        self._generate_maze_recursive(1, 1)
+        # Create maze using (iterative) recursive backtracking
+        self._carve_maze(1, 1)
         
-        # Set start and end positions
-        self.maze[self.start_pos[1]][self.start_pos[0]].is_wall = False
-        self.maze[self.start_pos[1]][self.start_pos[0]].is_start = True
-        self.maze[self.end_pos[1]][self.end_pos[0]].is_wall = False
-        self.maze[self.end_pos[1]][self.end_pos[0]].is_end = True
+        # Make sure start and end are open
+        self.walls[self.start_idx] = 0
+        self.walls[self.end_idx] = 0
         
         # Update display
         self.update_maze_display()
     
-    def _generate_maze_recursive(self, x: int, y: int):
-        """Recursive maze generation algorithm."""
-        self.maze[y][x].is_wall = False
-        self.maze[y][x].is_visited = True
+    def _carve_maze(self, x: int, y: int):
+        """Carve passages from (x, y) by backtracking over an explicit stack."""
+        size = self.maze_size
+        self.walls[y * size + x] = 0
         
-        # Define directions: right, down, left, up
-        directions = [(2, 0), (0, 2), (-2, 0), (0, -2)]
+        # Each frame holds a cell and its remaining directions (shuffled once per cell)
+        directions = list(_CARVE_STEPS)
         random.shuffle(directions)
+        stack = [(x, y, iter(directions))]
         
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            
-            # Check bounds
-            if 0 <= nx < self.maze_size and 0 <= ny < self.maze_size:
-                if self.maze[ny][nx].is_visited:
-                    continue
-                
-                # Remove wall between current and next cell
-                wall_x, wall_y = x + dx // 2, y + dy // 2
-                self.maze[wall_y][wall_x].is_wall = False
+        while stack:
+            x, y, remaining = stack[-1]
+            for dx, dy in remaining:
+                nx, ny = x + dx, y + dy
                 
-                # Recursively visit next cell
-                self._generate_maze_recursive(nx, ny)
+                # Check bounds; carved cells are no longer walls, so they count as visited
+                if 0 <= nx < size and 0 <= ny < size and self.walls[ny * size + nx]:
+                    # Remove wall between current and next cell, then carve from there
+                    self.walls[(y + dy // 2) * size + x + dx // 2] = 0
+                    self.walls[ny * size + nx] = 0
+                    
+                    directions = list(_CARVE_STEPS)
+                    random.shuffle(directions)
+                    stack.append((nx, ny, iter(directions)))
+                    break
+            else:
+                # Every direction tried; backtrack
+                stack.pop()
+    
+    def _color_for(self, idx: int) -> str:
+        """Return the display color for the cell at flat index idx."""
+        if idx == self.start_idx:
+            return self.colors["start"]
+        if idx == self.end_idx:
+            return self.colors["end"]
+        if self.is_path[idx]:
+            return self.colors["path"]
+        state = self.state[idx]
+        if state:
+            return self.state_colors[state]
+        return self.colors["wall"] if self.walls[idx] else self.colors["empty"]
+    
+    def _set_state(self, idx: int, state: int):
+        """Set a cell's algorithm state and queue it for repaint if it changed."""
+        if self.state[idx] != state:
+            self.state[idx] = state
+            self._dirty.add(idx)
+    
+    def _set_path(self, idx: int):
+        """Mark a cell as part of the solution path and queue it for repaint."""
+        self.is_path[idx] = 1
+        self._dirty.add(idx)
+    
+    def _start_pacing(self):
+        """Reset the replay clock before a search is animated."""
+        self._step_budget = 0.0
+        self._last_frame = asyncio.get_running_loop().time()
+    
+    async def _next_frame(self):
+        """Repaint, then wait for frames until the elapsed time earns another replay step."""
+        loop = asyncio.get_running_loop()
+        self.update_maze_display()
+        while self._step_budget < 1:
+            await asyncio.sleep(_FRAME_SECONDS)
+            now = loop.time()
+            self._step_budget += (now - self._last_frame) * self._cells_per_second
+            self._last_frame = now
     
     def update_maze_display(self):
-        """Update the visual representation of the maze."""
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                cell = self.maze[y][x]
-                container = self.maze_controls[y][x]
-                
-                if cell.is_start:
-                    container.bgcolor = self.colors["start"]
-                elif cell.is_end:
-                    container.bgcolor = self.colors["end"]
-                elif cell.is_path:
-                    container.bgcolor = self.colors["path"]
-                elif cell.algorithm_state == "visiting":
-                    container.bgcolor = self.colors["visiting"]
-                elif cell.algorithm_state == "frontier":
-                    container.bgcolor = self.colors["frontier"]
-                elif cell.algorithm_state == "visited":
-                    container.bgcolor = self.colors["visited"]
-                elif cell.is_wall:
-                    container.bgcolor = self.colors["wall"]
-                else:
-                    container.bgcolor = self.colors["empty"]
-        
-        self.page.update()
+        """Repaint the cells changed since the last update."""
+        changed = []
+        for idx in self._dirty:
+            container = self.maze_controls[idx]
+            color = self._color_for(idx)
+            if container.bgcolor != color:
+                container.bgcolor = color
+                changed.append(container)
+        self._dirty.clear()
+        
+        if changed:  # A bare page.update() would diff the whole page
+            self.page.update(*changed)
     
     def generate_maze_click(self, e):
         """Handle generate maze button click."""
@@ -309,11 +361,11 @@ class MazeSolver:
         if self.solving:
             return
         
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                cell = self.maze[y][x]
-                cell.is_path = False
-                cell.algorithm_state = "unvisited"
+        cell_count = self.maze_size * self.maze_size
+        self._dirty.update(idx for idx in range(cell_count) if self.state[idx] or self.is_path[idx])
+        self.state[:] = bytes(cell_count)
+        self.is_path[:] = bytes(cell_count)
+        self._frontier_cells.clear()
         
         self.update_maze_display()
         self.status_text.value = f"Path cleared. Ready to solve with {self.current_algorithm}."
@@ -346,46 +398,26 @@ class MazeSolver:
         self.status_text.value = "Solving with DFS (Depth-First Search)..."
         self.page.update()
         
-        stack = [self.start_pos]
-        parent = {}
-        visited = set()
-        
-        delay = (11 - self.speed_slider.value) * 0.05  # Convert speed to delay
+        # Run the search up front, then replay it at the selected speed
+        order, parent = dfs_trace(self.walls, self.maze_size, self.start_idx, self.end_idx)
         
-        while stack:
-            current = stack.pop()
-            x, y = current
-            
-            if current in visited:
-                continue
-            
-            visited.add(current)
-            if not (self.maze[y][x].is_start or self.maze[y][x].is_end):
-                self.maze[y][x].algorithm_state = "visiting"
-            self.update_maze_display()
-            await asyncio.sleep(delay)
+        self._start_pacing()
+        for idx in order:
+            self._set_state(idx, VISITING)
+            self._step_budget -= 1
+            if self._step_budget < 1 or idx == self.end_idx:
+                await self._next_frame()
             
-            if current == self.end_pos:
+            if idx == self.end_idx:
                 # Found the end, reconstruct path
-                await self.reconstruct_path(parent, current)
+                await self.reconstruct_path(parent, idx)
                 self.status_text.value = "DFS: Solution found! 🎉"
                 self.page.update()
                 return
             
-            if not (self.maze[y][x].is_start or self.maze[y][x].is_end):
-                self.maze[y][x].algorithm_state = "visited"
-            
-            # Explore neighbors (right, down, left, up)
-            for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-                nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                if (0 <= nx < self.maze_size and 0 <= ny < self.maze_size and
-                    not self.maze[ny][nx].is_wall and neighbor not in visited):
-                    stack.append(neighbor)
-                    if neighbor not in parent:
-                        parent[neighbor] = current
+            self._set_state(idx, VISITED)
         
+        self.update_maze_display()
         self.status_text.value = "DFS: No solution found! 😞"
         self.page.update()
     
@@ -394,77 +426,56 @@ class MazeSolver:
         self.status_text.value = "Solving with BFS (Breadth-First Search)..."
         self.page.update()
         
-        queue = deque([self.start_pos])
-        parent = {}
-        visited = set([self.start_pos])
+        # Run the search up front, then replay it at the selected speed
+        order, parent = bfs_trace(self.walls, self.maze_size, self.start_idx, self.end_idx)
         
-        delay = (11 - self.speed_slider.value) * 0.05  # Convert speed to delay
+        size = self.maze_size
         
-        while queue:
-            # Show current frontier (queue contents) in orange
-            for pos in queue:
-                if pos != queue[0]:  # Don't color the current cell being processed
-                    fx, fy = pos
-                    if not (self.maze[fy][fx].is_start or self.maze[fy][fx].is_end):
-                        self.maze[fy][fx].algorithm_state = "frontier"
-            
-            current = queue.popleft()
-            x, y = current
-            
+        self._start_pacing()
+        for idx in order:
             # Current cell being processed (yellow/amber)
-            if not (self.maze[y][x].is_start or self.maze[y][x].is_end):
-                self.maze[y][x].algorithm_state = "visiting"
+            self._frontier_cells.discard(idx)
+            self._set_state(idx, VISITING)
             
-            self.update_maze_display()
-            await asyncio.sleep(delay)
+            self._step_budget -= 1
+            if self._step_budget < 1 or idx == self.end_idx:
+                await self._next_frame()
             
-            if current == self.end_pos:
+            if idx == self.end_idx:
                 # Found the end, reconstruct path
-                await self.reconstruct_path(parent, current)
+                await self.reconstruct_path(parent, idx)
                 self.status_text.value = "BFS: Solution found! 🎉"
                 self.page.update()
                 return
             
             # Mark as visited (blue)
-            if not (self.maze[y][x].is_start or self.maze[y][x].is_end):
-                self.maze[y][x].algorithm_state = "visited"
+            self._set_state(idx, VISITED)
             
-            # Explore neighbors (right, down, left, up)
-            for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
+            # Cells discovered from this one join the frontier (right, down, left, up)
+            y, x = divmod(idx, size)
+            for dx, dy in DIRECTIONS:
                 nx, ny = x + dx, y + dy
-                neighbor = (nx, ny)
-                
-                if (0 <= nx < self.maze_size and 0 <= ny < self.maze_size and
-                    not self.maze[ny][nx].is_wall and neighbor not in visited):
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-                    parent[neighbor] = current
+                if 0 <= nx < size and 0 <= ny < size and parent[ny * size + nx] == idx:
+                    self._frontier_cells.add(ny * size + nx)
+                    self._set_state(ny * size + nx, FRONTIER)
         
+        self.update_maze_display()
         self.status_text.value = "BFS: No solution found! 😞"
         self.page.update()
     
-    async def reconstruct_path(self, parent: dict, end_pos: Tuple[int, int]):
+    async def reconstruct_path(self, parent: Sequence[int], end_idx: int):
         """Reconstruct and visualize the solution path."""
-        path = []
-        current = end_pos
-        
-        while current in parent:
-            path.append(current)
-            current = parent[current]
-        
-        path.reverse()
+        path = trace_path(parent, end_idx)
         
         # Clear previous frontier states for cleaner path display
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                if self.maze[y][x].algorithm_state == "frontier":
-                    self.maze[y][x].algorithm_state = "visited"
+        for idx in self._frontier_cells:
+            self._set_state(idx, VISITED)
+        self._frontier_cells.clear()
         
         # Animate path reconstruction with smooth effect
-        for i, pos in enumerate(path):
-            x, y = pos
-            if not (self.maze[y][x].is_start or self.maze[y][x].is_end):
-                self.maze[y][x].is_path = True
+        for idx in path:
+            if idx != self.end_idx:
+                self._set_path(idx)
                 self.update_maze_display()
                 
                 # Faster animation for shorter paths, slower for longer paths
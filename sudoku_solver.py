@@ -2,8 +2,16 @@
 Sudoku solver and generator module.
 """
 import random
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
+# Box number (0-8, row-major) of every cell, and the cells of every box
+_BOX_INDEX = tuple(tuple((r // 3) * 3 + c // 3 for c in range(9)) for r in range(9))
+_BOX_CELLS = tuple(
+    tuple((r, c) for r in range(9) for c in range(9) if _BOX_INDEX[r][c] == box)
+    for box in range(9)
+)
+
 
 class SudokuSolver:
     """Class to handle Sudoku solving and generation logic."""
@@ -24,54 +32,106 @@ class SudokuSolver:
                 return False
         
         # Check 3x3 box
-        start_row = row - row % 3
-        start_col = col - col % 3
-        for i in range(3):
-            for j in range(3):
-                if board[i + start_row][j + start_col] == num:
-                    return False
+        for i, j in _BOX_CELLS[_BOX_INDEX[row][col]]:
+            if board[i][j] == num:
+                return False
         
         return True
     
     def solve_sudoku(self, board: List[List[int]]) -> bool:
         """Solve Sudoku using backtracking."""
+        # Bit n of each mask is set when digit n is already used in that row, column or box
+        row_mask = [0] * 9
+        col_mask = [0] * 9
+        box_mask = [0] * 9
+        empty_cells = []
         for i in range(9):
             for j in range(9):
-                if board[i][j] == 0:
-                    for num in range(1, 10):
-                        if self.is_valid(board, i, j, num):
-                            board[i][j] = num
-                            if self.solve_sudoku(board):
-                                return True
-                            board[i][j] = 0
+                num = board[i][j]
+                box = _BOX_INDEX[i][j]
+                if num:
+                    bit = 1 << num
+                    row_mask[i] |= bit
+                    col_mask[j] |= bit
+                    box_mask[box] |= bit
+                else:
+                    empty_cells.append((i, j, box))
+        
+        return self._solve_masked(board, empty_cells, row_mask, col_mask, box_mask)
+    
+    def _solve_masked(self, board: List[List[int]], empty_cells: List[Tuple[int, int, int]],
+                      row_mask: List[int], col_mask: List[int], box_mask: List[int]) -> bool:
+        """Fill empty_cells with an explicit backtracking stack, branching on the most constrained cell."""
+        stack = []  # (row, col, box, placed bit, untried candidates) per filled cell
+        total = len(empty_cells)
+        k = 0
+        while k < total:
+            # Most-constrained cell first; a cell with no free digit fails immediately
+            best, best_count, candidates = k, 10, 0
+            for n in range(k, total):
+                i, j, box = empty_cells[n]
+                free = 0x3FE & ~(row_mask[i] | col_mask[j] | box_mask[box])
+                count = bin(free).count("1")
+                if count < best_count:
+                    best, best_count, candidates = n, count, free
+                    if count <= 1:
+                        break
+            
+            empty_cells[k], empty_cells[best] = empty_cells[best], empty_cells[k]
+            i, j, box = empty_cells[k]
+            
+            # Undo placements until some cell still has a digit left to try
+            while not candidates:
+                if not stack:
                     return False
+                i, j, box, bit, candidates = stack.pop()
+                row_mask[i] ^= bit
+                col_mask[j] ^= bit
+                box_mask[box] ^= bit
+                board[i][j] = 0
+                k -= 1
+            
+            bit = candidates & -candidates  # Lowest free digit
+            board[i][j] = bit.bit_length() - 1
+            row_mask[i] |= bit
+            col_mask[j] |= bit
+            box_mask[box] |= bit
+            stack.append((i, j, box, bit, candidates ^ bit))
+            k += 1
+        
         return True
     
-    def generate_complete_board(self) -> List[List[int]]:
-        """Generate a complete valid Sudoku board."""
+    def generate_complete_board(self, rng: Optional[random.Random] = None) -> List[List[int]]:
+        """Generate a complete valid Sudoku board, drawing randomness from rng if given."""
         board = [[0 for _ in range(9)] for _ in range(9)]
         
         # Fill the diagonal 3x3 boxes first
         for box in range(0, 9, 3):
-            self._fill_box(board, box, box)
+            self._fill_box(board, box, box, rng or random)
         
         # Solve the rest
         self.solve_sudoku(board)
         return board
     
-    def _fill_box(self, board: List[List[int]], row: int, col: int):
+    def _fill_box(self, board: List[List[int]], row: int, col: int, rng=random):
         """Fill a 3x3 box with random valid numbers."""
         nums = list(range(1, 10))
-        random.shuffle(nums)
+        rng.shuffle(nums)
         
         for i in range(3):
             for j in range(3):
                 board[row + i][col + j] = nums[i * 3 + j]
     
-    def generate_puzzle(self, difficulty: str = "medium") -> Tuple[List[List[int]], List[List[int]]]:
-        """Generate a Sudoku puzzle with given difficulty."""
-        # Generate complete board
-        complete_board = self.generate_complete_board()
+    def generate_puzzle(self, difficulty: str = "medium",
+                        seed: Optional[int] = None) -> Tuple[List[List[int]], List[List[int]]]:
+        """Generate a Sudoku puzzle with given difficulty; the same seed always gives the same puzzle."""
+        # Generate complete board (seeded boards are built once and cached)
+        if seed is None:
+            rng = random
+            complete_board = self.generate_complete_board()
+        else:
+            rng = random.Random(seed)
+            complete_board = [list(row) for row in _seeded_complete_board(seed)]
         puzzle_board = [row[:] for row in complete_board]  # Deep copy
         
         # Remove numbers based on difficulty
@@ -83,28 +143,38 @@ class SudokuSolver:
         
         cells_to_remove = difficulty_map.get(difficulty, 50)
         
-        # Randomly remove cells
-        removed = 0
-        while removed < cells_to_remove:
-            row = random.randint(0, 8)
-            col = random.randint(0, 8)
-            if puzzle_board[row][col] != 0:
-                puzzle_board[row][col] = 0
-                removed += 1
+        # Randomly remove cells: shuffle all 81 positions once and blank the first ones
+        cells = list(range(81))
+        rng.shuffle(cells)
+        for cell in cells[:cells_to_remove]:
+            row, col = divmod(cell, 9)
+            puzzle_board[row][col] = 0
         
         return puzzle_board, complete_board
     
     def check_solution(self, board: List[List[int]]) -> bool:
         """Check if the current board state is a valid complete solution."""
+        # One pass with a bitmask of seen digits per row, column and box
+        row_seen = [0] * 9
+        col_seen = [0] * 9
+        box_seen = [0] * 9
         for i in range(9):
             for j in range(9):
-                if board[i][j] == 0:
+                num = board[i][j]
+                if not 1 <= num <= 9:
                     return False
-                # Temporarily remove the number to check validity
-                temp = board[i][j]
-                board[i][j] = 0
-                if not self.is_valid(board, i, j, temp):
-                    board[i][j] = temp
+                bit = 1 << num
+                box = _BOX_INDEX[i][j]
+                if (row_seen[i] | col_seen[j] | box_seen[box]) & bit:
                     return False
-                board[i][j] = temp
-        return True
\ No newline at end of file
+                row_seen[i] |= bit
+                col_seen[j] |= bit
+                box_seen[box] |= bit
+        return True
+
+
+@lru_cache(maxsize=32)
+def _seeded_complete_board(seed: int) -> Tuple[Tuple[int, ...], ...]:
+    """Build the complete board for a seed, kept immutable so cached copies stay intact."""
+    board = SudokuSolver().generate_complete_board(random.Random(seed))
+    return tuple(tuple(row) for row in board)
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Test script for Sudoku game cell commits.
+"""
+from main import SudokuGame
+
+
+class FakePage:
+    """Minimal page that accepts updates without rendering anything."""
+    def __init__(self):
+        self.controls = []
+        self.dialog = None
+    
+    def add(self, *controls):
+        self.controls.extend(controls)
+    
+    def update(self, *controls):
+        pass
+
+
+class CellEvent:
+    """Stand-in for the event Flet passes to cell handlers."""
+    def __init__(self, control):
+        self.control = control
+
+
+def start_game() -> SudokuGame:
+    """Create a game with a fresh puzzle on a fake page."""
+    game = SudokuGame(FakePage())
+    game.new_game(None)
+    return game
+
+
+def type_digit(game: SudokuGame, index: int, digit: int, commit: bool = True):
+    """Type a digit into a cell, optionally leaving the cell afterwards."""
+    cell = game.board_cells[index]
+    cell.value = str(digit)
+    if commit:
+        game._cell_committed(CellEvent(cell))
+
+
+def wrong_digit(game: SudokuGame, index: int) -> int:
+    """Return a digit that is not the solution for the cell at index."""
+    return game.solution_board[index] % 9 + 1
+
+
+def expected_masks(game: SudokuGame):
+    """Recompute the row, column and box masks from the correctly placed digits."""
+    rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+    for index, num in enumerate(game.puzzle_board):
+        if num and num == game.solution_board[index]:
+            row, col = divmod(index, 9)
+            bit = 1 << (num - 1)
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[(row // 3) * 3 + col // 3] |= bit
+    return rows, cols, boxes
+
+
+def assert_masks(game: SudokuGame, step: str):
+    """Check the incrementally kept masks against a full recomputation."""
+    assert (game.row_mask, game.col_mask, game.box_mask) == expected_masks(game), \
+        f"Masks out of step after {step}"
+
+
+def test_pending_edits():
+    """Test that button actions commit a cell that has not been blurred yet."""
+    print("Testing pending cell edits...")
+    
+    # Solved board, then one cell retyped wrong without leaving it
+    game = start_game()
+    empty = sorted(game._empty_cells)
+    for index in empty:
+        type_digit(game, index, game.solution_board[index])
+    type_digit(game, empty[0], wrong_digit(game, empty[0]), commit=False)
+    game.check_solution(None)
+    assert "Congratulations" not in game.status_text.value, "Check must see the pending wrong digit"
+    assert game.mistakes == 1, "The pending wrong digit should count as a mistake"
+    print("✓ Check counts an edited but not blurred wrong digit")
+    
+    # Last digit typed without leaving the cell
+    game = start_game()
+    empty = sorted(game._empty_cells)
+    for index in empty[:-1]:
+        type_digit(game, index, game.solution_board[index])
+    type_digit(game, empty[-1], game.solution_board[empty[-1]], commit=False)
+    game.check_solution(None)
+    assert "Congratulations" in game.status_text.value, "Check must see the pending last digit"
+    print("✓ Check accepts an edited but not blurred last digit")
+    
+    # A hint must not overwrite a cell that is being typed in
+    game = start_game()
+    index = next(iter(game._empty_cells))
+    digit = wrong_digit(game, index)
+    type_digit(game, index, digit, commit=False)
+    game._empty_cells = {index}  # Make the typed cell the only hint candidate
+    game.give_hint(None)
+    assert game.board_cells[index].value == str(digit), "Hint must not overwrite a typed cell"
+    print("✓ Hint leaves an edited but not blurred cell alone")
+
+
+
+def test_before_game():
+    """Test that the board ignores input until a game has started."""
+    print("\nTesting the board before a game starts...")
+    
+    game = SudokuGame(FakePage())
+    for index in range(3):
+        type_digit(game, index, 5)
+    assert game.mistakes == 0, "Digits typed before a game must not count as mistakes"
+    assert not any(game.puzzle_board), "Digits typed before a game must not reach the board"
+    print("✓ Typing before a game is ignored")
+    
+    game.status_text.value = "Welcome"
+    game.solve_puzzle(None)
+    assert game.status_text.value == "Welcome", "Solve must do nothing before a game"
+    assert not any(game.puzzle_board), "Solve must not fill the board before a game"
+    print("✓ Solve before a game is ignored")
+    
+    game.new_game(None)
+    assert all(not cell.read_only for cell in game.board_cells if not cell.value), "New game must unlock empty cells"
+    print("✓ New game unlocks the board")
+
+
+
+def test_masks():
+    """Test that the digit masks follow every kind of cell change."""
+    print("\nTesting digit masks...")
+    
+    game = start_game()
+    assert_masks(game, "new game")
+    index = min(game._empty_cells)
+    
+    type_digit(game, index, wrong_digit(game, index))
+    assert_masks(game, "a wrong digit")
+    type_digit(game, index, game.solution_board[index])
+    assert_masks(game, "the right digit")
+    game.board_cells[index].value = ""
+    game._cell_committed(CellEvent(game.board_cells[index]))
+    assert_masks(game, "clearing the cell")
+    game.give_hint(None)
+    assert_masks(game, "a hint")
+    print("✓ Masks match the board after each change")
+    
+    # A digit already correctly placed in a row is not legal elsewhere in it
+    row, col, digit = next((k // 9, k % 9, num) for k in sorted(game._empty_cells)
+                           for num in game.puzzle_board[k - k % 9:k - k % 9 + 9] if num)
+    assert not game.is_legal(row, col, digit), "Placed digit should not be legal again"
+    print("✓ is_legal rejects a digit already in the row")
+
+
+if __name__ == "__main__":
+    test_pending_edits()
+    test_before_game()
+    test_masks()
\ No newline at end of file
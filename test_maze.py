@@ -2,6 +2,7 @@
 Test script for maze solver algorithms.
 """
 import asyncio
+from maze_kernels import bfs_trace, dfs_trace, trace_path
 
 
 class MazeCell:
@@ -109,5 +110,48 @@ def test_maze_algorithms():
     print("• BFS: Uses queue (FIFO), explores level by level, finds shortest path")
 
 
+def test_maze_kernels():
+    """Test the search kernels used by the maze solver."""
+    print("\nTesting Maze Kernels...")
+    
+    # 5x5 grid with a wall column that forces a detour through the bottom row
+    size = 5
+    layout = [
+        ".#...",
+        ".#.#.",
+        ".#.#.",
+        ".#.#.",
+        "...#.",
+    ]
+    walls = bytearray(1 if ch == "#" else 0 for row in layout for ch in row)
+    start, end = 0, 2  # (0, 0) to (2, 0)
+    
+    for name, trace in (("DFS", dfs_trace), ("BFS", bfs_trace)):
+        order, parent = trace(walls, size, start, end)
+        assert order[0] == start, f"{name} should start at the start cell"
+        assert order[-1] == end, f"{name} should stop at the end cell"
+        path = trace_path(parent, end)
+        assert path[-1] == end and start not in path, f"{name} path should run from start to end"
+        for a, b in zip([start] + path, path):
+            ay, ax = divmod(a, size)
+            by, bx = divmod(b, size)
+            assert abs(ax - bx) + abs(ay - by) == 1, f"{name} path should move one step at a time"
+            assert not walls[b], f"{name} path should not cross walls"
+        print(f"✓ {name} kernel finds a valid path")
+    
+    # BFS must find the shortest path: down 4, right 2, up 4
+    order, parent = bfs_trace(walls, size, start, end)
+    assert len(trace_path(parent, end)) == 10, "BFS should find the shortest path"
+    print("✓ BFS kernel finds the shortest path")
+    
+    # Walling off the end leaves no path
+    walls[2] = 1
+    for name, trace in (("DFS", dfs_trace), ("BFS", bfs_trace)):
+        order, parent = trace(walls, size, start, end)
+        assert end not in order, f"{name} should not reach a walled-off end"
+    print("✓ Kernels report unreachable ends")
+
+
 if __name__ == "__main__":
-    test_maze_algorithms()
\ No newline at end of file
+    test_maze_algorithms()
+    test_maze_kernels()
\ No newline at end of file
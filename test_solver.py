@@ -51,6 +51,54 @@ def test_sudoku_solver():
     else:
         print("Invalid move test (row): ✗")
     
+    print("\n3. Testing solution checker:")
+    _, solution = solver.generate_puzzle("easy")
+    broken = [row[:] for row in solution]
+    broken[0][0], broken[0][1] = broken[0][1], broken[0][0]  # Breaks two columns
+    
+    assert solver.check_solution(solution), "Checker should accept a valid solution"
+    assert not solver.check_solution(broken), "Checker should reject a broken solution"
+    print("Solution checker test: ✓")
+    
+    # The checker must not modify the board it inspects
+    snapshot = [row[:] for row in broken]
+    solver.check_solution(broken)
+    assert broken == snapshot, "Checker should leave the board untouched"
+    print("Solution checker leaves board untouched: ✓")
+    
+    print("\n4. Testing solver:")
+    board = [row[:] for row in test_board]
+    assert solver.solve_sudoku(board), "Solver should solve a valid puzzle"
+    assert solver.check_solution(board), "Solver should return a valid solution"
+    print("Solve test: ✓")
+    
+    # Givens must be kept as they are
+    assert all(board[i][j] == test_board[i][j] for i in range(9) for j in range(9) if test_board[i][j]), \
+        "Solver should keep the givens"
+    print("Solver keeps givens: ✓")
+    
+    # Row 0 leaves 1 and 2 for its first two cells, but column 1 already has a 1
+    unsolvable = [[0] * 9 for _ in range(9)]
+    unsolvable[0][2:] = [3, 4, 5, 6, 7, 8, 9]
+    unsolvable[3][0] = 1
+    unsolvable[6][1] = 1
+    board = [row[:] for row in unsolvable]
+    assert not solver.solve_sudoku(board), "Solver should report an unsolvable puzzle"
+    assert board == unsolvable, "Solver should restore the board after failing"
+    print("Unsolvable puzzle test: ✓")
+    
+    print("\n5. Testing seeded generation:")
+    first = solver.generate_puzzle("hard", seed=42)
+    second = solver.generate_puzzle("hard", seed=42)
+    assert first == second, "Same seed should give the same puzzle"
+    assert solver.check_solution(first[1]), "Seeded solution should be valid"
+    print("Same seed gives same puzzle: ✓")
+    
+    # Mutating a returned board must not leak into the cached one
+    first[1][0][0] = 0
+    assert solver.generate_puzzle("hard", seed=42) == second, "Cached board should not be shared"
+    print("Cached board is not shared: ✓")
+    
     print("\nAll tests completed!")
 
 